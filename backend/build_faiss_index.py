@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Build a FAISS IVF-PQ index from the existing ChromaDB collection
+Produces faiss_index.bin plus faiss_docstore.pkl (row -> content/metadata).
+The FastAPI server prefers these files when present and falls back to
+ChromaDB's HNSW otherwise. IVF-PQ keeps the whole index in RAM at a fraction
+of the footprint and searches with SIMD-friendly ADC distance tables, which
+matters as the collection grows past ~100k chunks.
+"""
+
+import pickle
+import chromadb
+import faiss
+import numpy as np
+
+FAISS_INDEX_FILE = "faiss_index.bin"
+FAISS_DOCSTORE_FILE = "faiss_docstore.pkl"
+
+EMBEDDING_DIM = 384
+PQ_SUBQUANTIZERS = 48  # 384 dims / 48 = 8 dims per sub-vector
+PQ_BITS = 8
+
+
+def build_faiss_index():
+    """Export the ChromaDB collection into a FAISS index + docstore"""
+
+    print("🚀 Building FAISS index from ChromaDB...")
+
+    # Pull everything out of the existing collection
+    print("🔍 Connecting to ChromaDB...")
+    try:
+        client = chromadb.PersistentClient(path="./chroma_db_free")
+        collection = client.get_collection("crossmint_docs")
+        count = collection.count()
+        print(f"✅ Collection has {count} documents")
+    except Exception as e:
+        print(f"❌ ChromaDB not available: {e}")
+        return False
+
+    if count == 0:
+        print("❌ Collection is empty — run rebuild_chromadb.py first")
+        return False
+
+    print("📚 Exporting embeddings and documents...")
+    data = collection.get(include=['embeddings', 'documents', 'metadatas'])
+    embeddings = np.asarray(data['embeddings'], dtype=np.float32)
+    docstore = [
+        {'content': doc, 'metadata': metadata}
+        for doc, metadata in zip(data['documents'], data['metadatas'])
+    ]
+
+    # Normalize so inner product == cosine similarity
+    faiss.normalize_L2(embeddings)
+
+    # IVF-PQ needs enough training points per centroid; below that a flat
+    # inner-product index is both exact and still fast at this scale
+    n = embeddings.shape[0]
+    nlist = max(1, min(256, n // 39))
+    if n < 1000:
+        print(f"ℹ️  Only {n} vectors — building exact IndexFlatIP instead of IVF-PQ")
+        index = faiss.IndexFlatIP(EMBEDDING_DIM)
+    else:
+        quantizer = faiss.IndexFlatIP(EMBEDDING_DIM)
+        index = faiss.IndexIVFPQ(
+            quantizer, EMBEDDING_DIM, nlist, PQ_SUBQUANTIZERS, PQ_BITS,
+            faiss.METRIC_INNER_PRODUCT
+        )
+        print(f"🧮 Training IVF-PQ (nlist={nlist})...")
+        index.train(embeddings)
+        index.nprobe = 8
+
+    index.add(embeddings)
+    print(f"✅ Indexed {index.ntotal} vectors")
+
+    # Persist index and the row-aligned docstore
+    faiss.write_index(index, FAISS_INDEX_FILE)
+    with open(FAISS_DOCSTORE_FILE, 'wb') as f:
+        pickle.dump(docstore, f)
+
+    print(f"🎉 Wrote {FAISS_INDEX_FILE} and {FAISS_DOCSTORE_FILE}")
+    print("💡 Restart the FastAPI server to pick up the FAISS index")
+    return True
+
+
+if __name__ == "__main__":
+    success = build_faiss_index()
+    if not success:
+        exit(1)
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Precompute nearest-neighbor lists for known FAQ queries
+Reads faq_queries.json (a list of query strings), runs the full embed + ChromaDB
+search for each, and stores the results in faq_cache.pkl. The FastAPI server
+loads this at startup so FAQ hits skip the encode and HNSW traversal entirely.
+"""
+
+import hashlib
+import orjson
+import os
+import pickle
+import chromadb
+from sentence_transformers import SentenceTransformer
+
+FAQ_QUERIES_FILE = "faq_queries.json"
+FAQ_CACHE_FILE = "faq_cache.pkl"
+
+
+def precompute_faq():
+    """Precompute and persist retrieval results for the FAQ query list"""
+
+    print("🚀 Precomputing FAQ nearest neighbors...")
+
+    # Load FAQ queries
+    if not os.path.exists(FAQ_QUERIES_FILE):
+        print(f"❌ {FAQ_QUERIES_FILE} not found! Add a JSON list of query strings.")
+        return False
+
+    with open(FAQ_QUERIES_FILE, 'rb') as f:
+        queries = orjson.loads(f.read())
+    print(f"✅ Loaded {len(queries)} FAQ queries")
+
+    # Connect to ChromaDB
+    print("🔍 Connecting to ChromaDB...")
+    try:
+        client = chromadb.PersistentClient(path="./chroma_db_free")
+        collection = client.get_collection("crossmint_docs")
+        print(f"✅ Collection has {collection.count()} documents")
+    except Exception as e:
+        print(f"❌ ChromaDB not available: {e}")
+        return False
+
+    # Load embedding model
+    print("🤖 Loading embedding model...")
+    model = SentenceTransformer('all-MiniLM-L6-v2')
+
+    # Run retrieval for every FAQ query
+    print("📝 Running retrieval for FAQ queries...")
+    faq_cache = {}
+    for query in queries:
+        query_norm = query.strip().lower()
+        embedding = model.encode([query_norm], normalize_embeddings=True).tolist()
+        results = collection.query(
+            query_embeddings=embedding,
+            n_results=5,
+            include=['distances']
+        )
+        key = hashlib.sha1(query_norm.encode()).hexdigest()
+        faq_cache[key] = {
+            'query': query_norm,
+            'doc_ids': results['ids'][0],
+            'distances': results['distances'][0],
+        }
+
+    # Persist the cache
+    with open(FAQ_CACHE_FILE, 'wb') as f:
+        pickle.dump(faq_cache, f)
+
+    print(f"🎉 Wrote {len(faq_cache)} entries to {FAQ_CACHE_FILE}")
+    print("💡 Restart the FastAPI server to pick up the new cache")
+    return True
+
+
+if __name__ == "__main__":
+    success = precompute_faq()
+    if not success:
+        exit(1)
@@ -4,10 +4,12 @@ Rebuild ChromaDB from content_chunks.json
 Run this script to initialize/reset your database with the correct schema
 """
 
-import json
+import hashlib
+import orjson
 import chromadb
 from chromadb.config import Settings
 import os
+import torch
 from sentence_transformers import SentenceTransformer
 from tqdm import tqdm
 
@@ -19,13 +21,14 @@ def rebuild_database():
     # Load content chunks
     print("📚 Loading content chunks...")
     try:
-        with open('content_chunks.json', 'r') as f:
-            chunks = json.load(f)
+        # orjson parses large chunk files several times faster than stdlib json
+        with open('content_chunks.json', 'rb') as f:
+            chunks = orjson.loads(f.read())
         print(f"✅ Loaded {len(chunks)} chunks")
     except FileNotFoundError:
         print("❌ content_chunks.json not found! Make sure it's in the current directory.")
         return False
-    except json.JSONDecodeError as e:
+    except orjson.JSONDecodeError as e:
         print(f"❌ Error parsing JSON: {e}")
         return False
     
@@ -46,9 +49,14 @@ def rebuild_database():
         print(f"📋 Existing collections: {[c.name for c in existing_collections]}")
         
         # Create collection with updated schema
+        # Cosine space + normalized embeddings: stored distances map cleanly to
+        # 1 - similarity and the per-query inner loop is a plain dot product
         collection = client.create_collection(
             name="crossmint_docs",
-            metadata={"description": "Crossmint support documentation"}
+            metadata={
+                "description": "Crossmint support documentation",
+                "hnsw:space": "cosine",
+            }
         )
         print("✅ Created new collection: crossmint_docs")
         
@@ -60,65 +68,100 @@ def rebuild_database():
         print(f"❌ ChromaDB initialization error: {e}")
         return False
     
-    # Load embedding model
+    # Load embedding model, preferring GPU/MPS for the bulk encode
     print("🤖 Loading embedding model...")
     try:
-        model = SentenceTransformer('all-MiniLM-L6-v2')
-        print("✅ Embedding model loaded")
+        if torch.cuda.is_available():
+            device = "cuda"
+        elif torch.backends.mps.is_available():
+            device = "mps"
+        else:
+            device = "cpu"
+        model = SentenceTransformer('all-MiniLM-L6-v2', device=device)
+        if device == "cuda":
+            # FP16 halves memory bandwidth; fine for MiniLM at bulk-encode scale
+            model.half()
+        print(f"✅ Embedding model loaded on {device}")
     except Exception as e:
         print(f"❌ Error loading embedding model: {e}")
         return False
     
-    # Process and add chunks
-    print("📝 Processing and adding chunks to database...")
-    batch_size = 50
-    
+    # Process chunks
+    print("📝 Processing chunks...")
+
     try:
-        for i in tqdm(range(0, len(chunks), batch_size), desc="Adding chunks"):
-            batch = chunks[i:i + batch_size]
-            
-            # Prepare batch data
-            documents = []
-            metadatas = []
-            ids = []
-            
-            for j, chunk in enumerate(batch):
-                chunk_id = f"chunk_{i + j}"
-                
-                # Extract content and metadata
-                content = chunk.get('content', chunk.get('text', ''))
-                if not content:
-                    print(f"⚠️  Skipping empty chunk {chunk_id}")
-                    continue
-                
-                # Build metadata
-                metadata = {
-                    'source': chunk.get('source', 'unknown'),
-                    'topic': chunk.get('topic', chunk.get('category', 'general')),
-                    'chunk_index': chunk.get('chunk_index', i + j),
-                }
-                
-                # Add any additional metadata fields
-                for key in ['title', 'url', 'section', 'category']:
-                    if key in chunk and chunk[key]:
-                        metadata[key] = str(chunk[key])
-                
-                documents.append(content)
-                metadatas.append(metadata)
-                ids.append(chunk_id)
-            
-            if documents:  # Only add if we have valid documents
-                # Generate embeddings
-                embeddings = model.encode(documents).tolist()
-                
-                # Add to collection
-                collection.add(
-                    documents=documents,
-                    metadatas=metadatas,
-                    ids=ids,
-                    embeddings=embeddings
-                )
-    
+        # First pass: collect all documents, metadata and ids. Scraped docs
+        # often repeat the same text across cross-linked pages, so content is
+        # hashed and each unique text is only encoded once; duplicate ids
+        # share the same embedding row.
+        documents = []
+        metadatas = []
+        ids = []
+        embedding_rows = []  # row in the unique-embedding matrix for each id
+        unique_documents = []
+        row_for_hash = {}
+        id_for_hash = {}
+
+        for i, chunk in enumerate(chunks):
+            chunk_id = f"chunk_{i}"
+
+            # Extract content and metadata
+            content = chunk.get('content', chunk.get('text', ''))
+            if not content:
+                print(f"⚠️  Skipping empty chunk {chunk_id}")
+                continue
+
+            # Keep metadata minimal: only the fields /query actually returns,
+            # under short keys. Metadata lives in SQLite rows that are read on
+            # every query, so smaller rows mean fewer B-tree pages per search.
+            metadata = {
+                't': str(chunk.get('title', 'Crossmint Documentation')),
+                'u': str(chunk.get('url', 'https://docs.crossmint.com')),
+            }
+
+            content_hash = hashlib.blake2b(content.encode(), digest_size=16).hexdigest()
+            row = row_for_hash.get(content_hash)
+            if row is None:
+                row = len(unique_documents)
+                row_for_hash[content_hash] = row
+                id_for_hash[content_hash] = chunk_id
+                unique_documents.append(content)
+
+            documents.append(content)
+            metadatas.append(metadata)
+            ids.append(chunk_id)
+            embedding_rows.append(row)
+
+        # Encode everything in one call so the model sees large batches;
+        # per-call Python/torch overhead dominates at small batch sizes
+        print(f"🧮 Encoding {len(unique_documents)} unique documents "
+              f"({len(documents) - len(unique_documents)} duplicates skipped)...")
+        unique_embeddings = model.encode(
+            unique_documents,
+            batch_size=256,
+            convert_to_numpy=True,
+            normalize_embeddings=True,
+            show_progress_bar=True
+        )
+
+        # Expand back so every id (duplicates included) has its embedding
+        embeddings = unique_embeddings[embedding_rows]
+
+        # Persist the content-hash -> id map for incremental rebuilds
+        with open('content_hashes.json', 'wb') as f:
+            f.write(orjson.dumps(id_for_hash))
+
+        # Second pass: bulk-insert into ChromaDB
+        print("📤 Adding chunks to database...")
+        insert_batch_size = 1000
+        for i in tqdm(range(0, len(documents), insert_batch_size), desc="Adding chunks"):
+            collection.add(
+                documents=documents[i:i + insert_batch_size],
+                metadatas=metadatas[i:i + insert_batch_size],
+                ids=ids[i:i + insert_batch_size],
+                embeddings=embeddings[i:i + insert_batch_size].tolist()
+            )
+
     except Exception as e:
         print(f"❌ Error processing chunks: {e}")
         return False
@@ -0,0 +1,60 @@
+"""Regression tests for the semantic response cache bookkeeping.
+
+The score matrix is a lazily built snapshot of the cache; a hit's move_to_end
+reorders the dict, so rows must resolve through a key list captured when the
+matrix was built — not through the live dict order.
+"""
+
+import numpy as np
+import pytest
+
+import main
+
+
+def _unit_vector(seed):
+    rng = np.random.default_rng(seed)
+    vector = rng.random(384, dtype=np.float32)
+    return vector / np.linalg.norm(vector)
+
+
+def _response(query, text):
+    return main.QueryResponse(
+        query=query,
+        response=text,
+        sources=[],
+        timestamp="2026-01-01T00:00:00",
+        method='RAG (Full Knowledge Base)'
+    )
+
+
+@pytest.fixture(autouse=True)
+def clean_cache():
+    main.semantic_cache.clear()
+    main._semantic_cache_matrix = None
+    main._semantic_cache_keys = None
+    yield
+    main.semantic_cache.clear()
+    main._semantic_cache_matrix = None
+    main._semantic_cache_keys = None
+
+
+def test_repeated_hits_return_the_matching_entry():
+    a = _unit_vector(1)
+    b = _unit_vector(2)
+    main.semantic_cache_insert(a, _response("question a", "answer a"))
+    main.semantic_cache_insert(b, _response("question b", "answer b"))
+
+    # Two consecutive lookups for A: the first hit's move_to_end reorders the
+    # dict, and the second used to map the argmax row through the new order
+    # and return B's answer for A's question
+    for _ in range(2):
+        hit = main.semantic_cache_lookup("question a", a)
+        assert hit is not None
+        assert hit.response == "answer a"
+
+
+def test_dissimilar_query_misses():
+    main.semantic_cache_insert(_unit_vector(1), _response("question a", "answer a"))
+
+    # Random 384-dim unit vectors are nowhere near the 0.95 threshold
+    assert main.semantic_cache_lookup("unrelated", _unit_vector(3)) is None
@@ -4,62 +4,88 @@ Upload documents from content_chunks.json to Pinecone using OpenAI embeddings
 Run this script from your backend directory where content_chunks.json is located
 """
 
-import json
+import asyncio
+import orjson
 import os
-from openai import OpenAI
+from openai import AsyncOpenAI, RateLimitError
 from pinecone import Pinecone
 from tqdm import tqdm
-import time
 
-def upload_to_pinecone():
+# How many embedding requests may be in flight at once
+MAX_CONCURRENT_REQUESTS = 8
+EMBED_BATCH_SIZE = 20
+UPSERT_BATCH_SIZE = 100  # Pinecone's recommended max batch
+MAX_RETRIES = 5
+
+# text-embedding-3-small truncated to 512 dims: near-identical recall at a
+# third of the storage/bandwidth. The Pinecone index must be created with
+# dimension=512 and metric="cosine", and query-time embeddings must request
+# the same dimensions.
+EMBED_MODEL = "text-embedding-3-small"
+EMBED_DIMENSIONS = 512
+
+
+async def embed_batch(openai_client, semaphore, texts):
+    """Embed one batch of texts, backing off exponentially on rate limits"""
+    async with semaphore:
+        for attempt in range(MAX_RETRIES):
+            try:
+                response = await openai_client.embeddings.create(
+                    model=EMBED_MODEL,
+                    input=texts,
+                    dimensions=EMBED_DIMENSIONS
+                )
+                return [item.embedding for item in response.data]
+            except RateLimitError:
+                wait = 2 ** attempt
+                print(f"⏳ Rate limited, retrying in {wait}s...")
+                await asyncio.sleep(wait)
+        raise RuntimeError(f"Embedding batch failed after {MAX_RETRIES} retries")
+
+
+async def upload_to_pinecone():
     """Upload all documents to Pinecone using OpenAI embeddings"""
-    
+
     # Get API keys
     pinecone_api_key = input("Enter your Pinecone API key: ")
     openai_api_key = input("Enter your OpenAI API key: ")
-    
+
     # Initialize clients
     pc = Pinecone(api_key=pinecone_api_key)
-    openai_client = OpenAI(api_key=openai_api_key)
-    
+    openai_client = AsyncOpenAI(api_key=openai_api_key)
+
     # Connect to index
     index_name = "crossmint-docs"
     index = pc.Index(index_name)
-    
+
     print(f"✅ Connected to Pinecone index: {index_name}")
-    
+
     # Load documents
     print("📚 Loading content chunks...")
-    with open('content_chunks.json', 'r') as f:
-        chunks = json.load(f)
+    with open('content_chunks.json', 'rb') as f:
+        chunks = orjson.loads(f.read())
     print(f"✅ Loaded {len(chunks)} chunks")
-    
+
     print("🤖 Using OpenAI embeddings...")
-    
-    # Process in batches
-    batch_size = 20  # Smaller batches for API rate limits
-    total_uploaded = 0
-    
-    print("📤 Uploading to Pinecone with OpenAI embeddings...")
-    
-    for i in tqdm(range(0, len(chunks), batch_size), desc="Uploading batches"):
-        batch = chunks[i:i + batch_size]
-        
-        # Prepare batch data
-        vectors = []
+
+    # Prepare all batches up front
+    all_batches = []  # list of (texts, [(chunk_id, metadata), ...])
+    for i in range(0, len(chunks), EMBED_BATCH_SIZE):
+        batch = chunks[i:i + EMBED_BATCH_SIZE]
+
         texts_to_embed = []
         batch_metadata = []
-        
+
         for j, chunk in enumerate(batch):
             chunk_id = f"chunk_{i + j}"
-            
+
             # Get content
             content = chunk.get('content', chunk.get('text', ''))
             if not content:
                 continue
-            
+
             texts_to_embed.append(content)
-            
+
             # Prepare metadata
             metadata = {
                 'content': content,
@@ -69,63 +95,60 @@ def upload_to_pinecone():
                 'topic': chunk.get('topic', chunk.get('category', 'general')),
                 'chunk_index': chunk.get('chunk_index', i + j)
             }
-            
+
             batch_metadata.append((chunk_id, metadata))
-        
-        if not texts_to_embed:
-            continue
-        
-        # Generate embeddings with OpenAI
-        try:
-            response = openai_client.embeddings.create(
-                model="text-embedding-ada-002",
-                input=texts_to_embed
-            )
-            
-            # Prepare vectors for Pinecone
-            for idx, embedding_data in enumerate(response.data):
-                chunk_id, metadata = batch_metadata[idx]
-                vectors.append({
-                    'id': chunk_id,
-                    'values': embedding_data.embedding,
-                    'metadata': metadata
-                })
-            
-            # Upload batch to Pinecone
-            if vectors:
-                index.upsert(vectors=vectors)
-                total_uploaded += len(vectors)
-                
-            # Rate limiting - be nice to OpenAI API
-            time.sleep(1)
-            
-        except Exception as e:
-            print(f"❌ Error processing batch {i}: {e}")
-            continue
-    
+
+        if texts_to_embed:
+            all_batches.append((texts_to_embed, batch_metadata))
+
+    # Embed all batches concurrently, bounded by the semaphore
+    print(f"📤 Embedding {len(all_batches)} batches concurrently...")
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+    embedding_results = await asyncio.gather(
+        *[embed_batch(openai_client, semaphore, texts) for texts, _ in all_batches]
+    )
+
+    # Flatten into Pinecone vectors
+    vectors = []
+    for (_, batch_metadata), embeddings in zip(all_batches, embedding_results):
+        for (chunk_id, metadata), embedding in zip(batch_metadata, embeddings):
+            vectors.append({
+                'id': chunk_id,
+                'values': embedding,
+                'metadata': metadata
+            })
+
+    # Upload to Pinecone in its recommended batch size
+    print("📤 Uploading to Pinecone...")
+    total_uploaded = 0
+    for i in tqdm(range(0, len(vectors), UPSERT_BATCH_SIZE), desc="Upserting batches"):
+        index.upsert(vectors=vectors[i:i + UPSERT_BATCH_SIZE])
+        total_uploaded += len(vectors[i:i + UPSERT_BATCH_SIZE])
+
     print(f"🎉 Upload complete! {total_uploaded} documents uploaded to Pinecone")
-    
+
     # Test query
     print("🔍 Testing with sample query...")
     try:
-        query_response = openai_client.embeddings.create(
-            model="text-embedding-ada-002",
-            input=["How do I create an NFT?"]
+        query_response = await openai_client.embeddings.create(
+            model=EMBED_MODEL,
+            input=["How do I create an NFT?"],
+            dimensions=EMBED_DIMENSIONS
         )
         query_embedding = query_response.data[0].embedding
-        
+
         results = index.query(vector=query_embedding, top_k=3, include_metadata=True)
-        
+
         print("✅ Sample query results:")
         for match in results['matches']:
             print(f"  - {match['metadata']['title']} (score: {match['score']:.3f})")
-            
+
     except Exception as e:
         print(f"❌ Error testing query: {e}")
-    
+
     print(f"💡 Your Pinecone API key: {pinecone_api_key}")
     print(f"💡 Your OpenAI API key: {openai_api_key}")
     print("💡 Save these API keys - you'll need them for your Vercel app!")
 
 if __name__ == "__main__":
-    upload_to_pinecone()
\ No newline at end of file
+    asyncio.run(upload_to_pinecone())
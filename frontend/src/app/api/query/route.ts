@@ -85,9 +85,12 @@ async function getQueryEmbedding(text: string): Promise<number[]> {
     apiKey: process.env.OPENAI_API_KEY,
   });
 
+  // Must match the model and dimensions used by upload_to_pinecone.py,
+  // otherwise Pinecone rejects the query with a dimension mismatch
   const response = await openai.embeddings.create({
-    model: "text-embedding-ada-002",
+    model: "text-embedding-3-small",
     input: text,
+    dimensions: 512,
   });
 
   return response.data[0].embedding;